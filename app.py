@@ -1,28 +1,58 @@
-from flask import Flask, request, jsonify, send_file, session, render_template
+from flask import Flask, Blueprint, request, jsonify, send_file, session
+from flask.cli import with_appcontext
 from flask_cors import CORS
 from models import db, User, Project, Content, RefinementHistory
 from gemini_client import GeminiClient
-from document_generator import DocumentGenerator
+from static_delivery import StaticDelivery
+from json_provider import FastJSONProvider
+from compression import ResponseCompression
+from idempotency import idempotent
+import click
 import io
 import json
 import bcrypt
 import os
 
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
-app = Flask(__name__, 
-            static_folder='static',
-            template_folder='templates')
-app.secret_key = 'your-flask-secret-key-here-change-in-production'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///documents.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-# Initialize extensions
-db.init_app(app)
-CORS(app, supports_credentials=True)
+# Extensions are bound to an app in create_app()
+cors = CORS()
+static_delivery = StaticDelivery()
+compression = ResponseCompression()
+
+bp = Blueprint('main', __name__)
 
 # Gemini API configuration
 gemini_client = GeminiClient(GEMINI_API_KEY)
 
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create the database tables."""
+    db.create_all()
+    click.echo('Initialized the database.')
+
+def create_app(config=None):
+    app = Flask(__name__, 
+                static_folder='static',
+                template_folder='templates')
+    app.secret_key = 'your-flask-secret-key-here-change-in-production'
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///documents.db'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if config:
+        app.config.update(config)
+    app.json = FastJSONProvider(app)
+    
+    # Initialize extensions
+    db.init_app(app)
+    cors.init_app(app, supports_credentials=True)
+    static_delivery.init_app(app)
+    compression.init_app(app)
+    
+    app.register_blueprint(bp)
+    app.cli.add_command(init_db_command)
+    return app
+
 # Password hashing functions
 def hash_password(password):
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
@@ -35,28 +65,28 @@ def get_user_id_from_session():
     return session.get('user_id')
 
 # Frontend Routes
-@app.route('/')
+@bp.route('/')
 def index():
-    return render_template('index.html')
+    return static_delivery.page('index.html')
 
-@app.route('/login')
+@bp.route('/login')
 def login_page():
-    return render_template('login.html')
+    return static_delivery.page('login.html')
 
-@app.route('/register')
+@bp.route('/register')
 def register_page():
-    return render_template('register.html')
+    return static_delivery.page('register.html')
 
-@app.route('/dashboard')
+@bp.route('/dashboard')
 def dashboard_page():
-    return render_template('dashboard.html')
+    return static_delivery.page('dashboard.html')
 
-@app.route('/editor')
+@bp.route('/editor')
 def editor_page():
-    return render_template('editor.html')
+    return static_delivery.page('editor.html')
 
 # API Routes
-@app.route('/api/register', methods=['POST'])
+@bp.route('/api/register', methods=['POST'])
 def register():
     data = request.get_json()
     email = data.get('email')
@@ -85,7 +115,7 @@ def register():
         db.session.rollback()
         return jsonify({'error': 'Registration failed'}), 500
 
-@app.route('/api/login', methods=['POST'])
+@bp.route('/api/login', methods=['POST'])
 def login():
     data = request.get_json()
     email = data.get('email')
@@ -100,12 +130,12 @@ def login():
     
     return jsonify({'error': 'Invalid credentials'}), 401
 
-@app.route('/api/logout', methods=['POST'])
+@bp.route('/api/logout', methods=['POST'])
 def logout():
     session.clear()
     return jsonify({'message': 'Logout successful'})
 
-@app.route('/api/check-auth', methods=['GET'])
+@bp.route('/api/check-auth', methods=['GET'])
 def check_auth():
     user_id = get_user_id_from_session()
     if user_id:
@@ -113,7 +143,7 @@ def check_auth():
         return jsonify({'authenticated': True, 'user_id': user_id, 'email': user.email})
     return jsonify({'authenticated': False}), 401
 
-@app.route('/api/projects', methods=['GET'])
+@bp.route('/api/projects', methods=['GET'])
 def get_projects():
     user_id = get_user_id_from_session()
     if not user_id:
@@ -135,7 +165,7 @@ def get_projects():
     
     return jsonify(projects_list)
 
-@app.route('/api/projects', methods=['POST'])
+@bp.route('/api/projects', methods=['POST'])
 def create_project():
     user_id = get_user_id_from_session()
     if not user_id:
@@ -159,7 +189,7 @@ def create_project():
         db.session.rollback()
         return jsonify({'error': 'Failed to create project'}), 500
 
-@app.route('/api/projects/<int:project_id>', methods=['GET'])
+@bp.route('/api/projects/<int:project_id>', methods=['GET'])
 def get_project(project_id):
     user_id = get_user_id_from_session()
     if not user_id:
@@ -191,7 +221,7 @@ def get_project(project_id):
     return jsonify(project_dict)
 
 # ADD THIS DELETE ENDPOINT
-@app.route('/api/projects/<int:project_id>', methods=['DELETE'])
+@bp.route('/api/projects/<int:project_id>', methods=['DELETE'])
 def delete_project(project_id):
     user_id = get_user_id_from_session()
     if not user_id:
@@ -217,7 +247,8 @@ def delete_project(project_id):
         print(f"Error deleting project: {e}")
         return jsonify({'error': 'Failed to delete project'}), 500
 
-@app.route('/api/projects/<int:project_id>/generate', methods=['POST'])
+@bp.route('/api/projects/<int:project_id>/generate', methods=['POST'])
+@idempotent
 def generate_content(project_id):
     user_id = get_user_id_from_session()
     if not user_id:
@@ -234,7 +265,7 @@ def generate_content(project_id):
     for section in outline:
         prompt = f"Write concise, focused content for the section: '{section['title']}' about: {project.topic}. Keep it brief and to the point - maximum 150-200 words suitable for one page/slide."
         
-        content = gemini_client.generate_content(prompt, project.topic)
+        content = gemini_client.generate_content(prompt, project.topic, section_title=section['title'])
         
         if content:
             new_content = Content(
@@ -249,7 +280,8 @@ def generate_content(project_id):
     db.session.commit()
     return jsonify({'message': f'Content generated successfully for {generated_count} sections'})
 
-@app.route('/api/projects/<int:project_id>/refine', methods=['POST'])
+@bp.route('/api/projects/<int:project_id>/refine', methods=['POST'])
+@idempotent
 def refine_content(project_id):
     user_id = get_user_id_from_session()
     if not user_id:
@@ -293,7 +325,8 @@ def refine_content(project_id):
     
     return jsonify({'error': 'Failed to refine content'}), 500
 
-@app.route('/api/generate-outline', methods=['POST'])
+@bp.route('/api/generate-outline', methods=['POST'])
+@idempotent
 def generate_outline():
     user_id = get_user_id_from_session()
     if not user_id:
@@ -331,7 +364,7 @@ def generate_outline():
             ]
             return jsonify({'outline': slides})
 
-@app.route('/api/projects/<int:project_id>/export', methods=['GET'])
+@bp.route('/api/projects/<int:project_id>/export', methods=['GET'])
 def export_document(project_id):
     user_id = get_user_id_from_session()
     if not user_id:
@@ -357,6 +390,9 @@ def export_document(project_id):
         'content_text': content.content_text
     } for content in contents]
     
+    # python-docx/python-pptx are only loaded by workers that actually export
+    from document_generator import DocumentGenerator
+    
     if project_dict['document_type'] == 'docx':
         doc = DocumentGenerator.generate_docx(project_dict, contents_list)
         buffer = io.BytesIO()
@@ -370,10 +406,8 @@ def export_document(project_id):
         buffer.seek(0)
         return send_file(buffer, as_attachment=True, download_name=f"{project_dict['title']}.pptx", mimetype='application/vnd.openxmlformats-officedocument.presentationml.presentation')
 
-with app.app_context():
-    db.create_all()
-
 if __name__ == '__main__':
+    app = create_app()
     port = int(os.environ.get('PORT', 5000))
     print(f"Starting AI Document Generator on port {port}")
     print("Note: Using mock AI functions - no external API required")
@@ -0,0 +1,85 @@
+"""Benchmark JSON serialization and compression of large API payloads.
+
+Builds get_project/get_projects shaped payloads in memory (no database)
+and reports serialization time for the stdlib and FastJSONProvider, plus
+bytes on the wire for each Accept-Encoding.
+
+Run from the project root:
+
+    python benchmarks/bench_api_payloads.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask.json.provider import DefaultJSONProvider
+
+from app import create_app
+from fallback_generator import FallbackGenerator
+
+ENCODINGS = ['identity', 'deflate', 'gzip']
+
+app = create_app()
+
+
+def _project(project_id, sections, versions):
+    generator = FallbackGenerator()
+    topic = f'Quarterly strategy review {project_id}'
+    outline = [{'id': f'section_{i}', 'title': f'Section {i}'} for i in range(sections)]
+    return {
+        'id': project_id,
+        'title': topic,
+        'document_type': 'docx',
+        'topic': topic,
+        'outline': outline,
+        'created_at': '2025-11-26T01:06:52',
+        'contents': [{
+            'id': i * versions + v,
+            'section_id': section['id'],
+            'section_title': section['title'],
+            'content_text': generator.generate_section(f"{section['title']} v{v}", topic) * 3,
+            'version': v + 1,
+        } for i, section in enumerate(outline) for v in range(versions)],
+    }
+
+
+def _time(fn, n):
+    best = float('inf')
+    for _ in range(n):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    payloads = {
+        'get_project (12 sections x 20 versions)': _project(1, 12, 20),
+        'get_project (40 sections x 50 versions)': _project(2, 40, 50),
+        'get_projects (500 outlines)': [
+            {k: v for k, v in _project(i, 8, 0).items() if k != 'contents'} for i in range(500)
+        ],
+    }
+    stdlib = DefaultJSONProvider(app)
+    compress = app.extensions['compression'].compress_response
+
+    for name, payload in payloads.items():
+        print(name)
+        with app.app_context():
+            std_ms = _time(lambda: stdlib.response(payload), 20)
+            fast_ms = _time(lambda: app.json.response(payload), 20)
+        print(f"  serialize   stdlib {std_ms:8.2f} ms   {type(app.json).__name__} {fast_ms:8.2f} ms")
+
+        for encoding in ENCODINGS:
+            with app.test_request_context(headers={'Accept-Encoding': encoding}):
+                start = time.perf_counter()
+                response = compress(app.json.response(payload))
+                total_ms = (time.perf_counter() - start) * 1000
+            print(f"  {encoding:<9} {len(response.get_data()):>10,} bytes   {total_ms:8.2f} ms serialize+encode")
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Track cold-start cost of a worker using ``python -X importtime``.
+
+Each run starts a fresh interpreter that imports app and calls
+create_app(), parses the importtime log on stderr and reports the
+median cumulative import time, the slowest top-level imports and
+whether any of the lazily loaded libraries were pulled in.
+
+Run from the project root:
+
+    python benchmarks/bench_startup.py [--runs N] [--budget-ms MS]
+
+With --budget-ms the script exits non-zero when the median exceeds the
+budget, so it can gate CI.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP = "from app import create_app; create_app()"
+LAZY_MODULES = ['docx', 'pptx', 'requests']
+
+
+def _parse_importtime(stderr):
+    """Return [(module, cumulative_us, depth)] in the order importtime logged them."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), int(cumulative_us), depth))
+    return modules
+
+
+def _children(modules, parent):
+    """Direct imports of a top-level module; importtime logs children before their parent."""
+    names = [name for name, _, _ in modules]
+    children = []
+    for name, cumulative, depth in reversed(modules[:names.index(parent)]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((cumulative, name))
+    return sorted(children, reverse=True)
+
+
+def _run_once():
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', STARTUP],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    return wall_ms, _parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float)
+    args = parser.parse_args()
+
+    _run_once()  # warm the filesystem and bytecode caches
+    runs = [_run_once() for _ in range(args.runs)]
+    app_ms = statistics.median(
+        next(cumulative for name, cumulative, _ in modules if name == 'app') for _, modules in runs) / 1000
+    wall_ms = statistics.median(wall for wall, _ in runs)
+
+    print(f"import app (cumulative): {app_ms:8.1f} ms  (median of {args.runs})")
+    print(f"process wall time:       {wall_ms:8.1f} ms")
+
+    _, modules = runs[-1]
+    print("\nslowest imports under app:")
+    for cumulative, name in _children(modules, 'app')[:10]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    imported = {name for name, _, _ in modules}
+    loaded = [name for name in LAZY_MODULES if name in imported]
+    print(f"\nlazy modules loaded at startup: {', '.join(loaded) or 'none'}")
+
+    if args.budget_ms is not None and app_ms > args.budget_ms:
+        print(f"FAIL: {app_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        return 1
+    return 1 if loaded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
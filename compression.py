@@ -0,0 +1,62 @@
+import gzip
+import zlib
+
+from flask import current_app, request
+
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html', 'text/css', 'text/plain', 'application/javascript'}
+
+
+class ResponseCompression:
+    """Compress dynamic responses on the fly according to Accept-Encoding.
+
+    Only bodies of at least COMPRESS_MIN_SIZE bytes with a compressible
+    mimetype are touched. Responses that are streamed, passed through
+    (send_file), already carry a Content-Encoding or were negotiated by
+    StaticDelivery (``precompressed``) are left alone.
+    """
+
+    encoders = {
+        'gzip': lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+        'deflate': lambda data, level: zlib.compress(data, level),
+    }
+
+    def __init__(self, app=None, min_size=1024, level=6):
+        self.min_size = min_size
+        self.level = level
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        # The constructor arguments are only defaults; each app's config is authoritative
+        app.config.setdefault('COMPRESS_MIN_SIZE', self.min_size)
+        app.config.setdefault('COMPRESS_LEVEL', self.level)
+        app.after_request(self.compress_response)
+        app.extensions['compression'] = self
+
+    def compress_response(self, response):
+        response.vary.add('Accept-Encoding')
+        if (response.direct_passthrough
+                or getattr(response, 'precompressed', False)
+                or response.is_streamed
+                or not 200 <= response.status_code < 300
+                or response.status_code == 204
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+
+        encoding = request.accept_encodings.best_match(self.encoders)
+        if encoding is None:
+            return response
+
+        config = current_app.config
+        data = response.get_data()
+        if len(data) < config['COMPRESS_MIN_SIZE']:
+            return response
+
+        response.set_data(self.encoders[encoding](data, config['COMPRESS_LEVEL']))
+        response.content_encoding = encoding
+        etag, _ = response.get_etag()
+        if etag:
+            # The compressed body is a different representation of the same resource
+            response.set_etag(f"{etag}-{encoding}", weak=True)
+        return response
@@ -0,0 +1,115 @@
+import string
+import zlib
+
+
+class _Template:
+    """A template pre-split into literal parts so rendering is one list copy and str.join.
+
+    ``{topic_title}`` is an alias of ``{topic}`` with its own default.
+    When no topic is given the defaults are already baked into the parts
+    and only ``{section}`` is filled in.
+    """
+
+    def __init__(self, text, **defaults):
+        self.parts = []
+        self.slots = []
+        self.bare_slots = []
+        bare_parts = []
+        for literal, field, _, _ in string.Formatter().parse(text):
+            self.parts.append(literal)
+            bare_parts.append(literal)
+            if field is None:
+                continue
+            position = len(self.parts)
+            self.slots.append((position, 0 if field == 'section' else 1))
+            if field == 'section':
+                self.bare_slots.append(position)
+                bare_parts.append('')
+            else:
+                bare_parts.append(defaults[field])
+            self.parts.append('')
+        self.bare_parts = bare_parts
+
+    def render(self, section, topic):
+        if topic:
+            parts = self.parts.copy()
+            values = (section, topic)
+            for position, index in self.slots:
+                parts[position] = values[index]
+        else:
+            parts = self.bare_parts.copy()
+            for position in self.bare_slots:
+                parts[position] = section
+        return ''.join(parts)
+
+
+# Section-specific templates, matched in order against the lowercased section title
+_KEYWORD_TEMPLATES = (
+    ('introduction', _Template(
+        """Introduction to {topic_title}
+
+This document provides a focused overview of {topic}. The introduction establishes context, defines key terms, and outlines the document structure.
+
+Key objectives include providing background information, establishing relevance, and previewing main sections. This analysis aims to deliver valuable insights for informed decision-making.""",
+        topic='the chosen subject', topic_title='the Topic')),
+    ('conclusion', _Template(
+        """Conclusion and Recommendations
+
+Based on the analysis presented, key conclusions regarding {topic} include identified opportunities, current challenges, and strategic recommendations.
+
+Main findings suggest potential for improvement and optimization. Recommendations focus on implementation strategies and success measurement.""",
+        topic='the subject matter')),
+    ('background', _Template(
+        """Background and Context
+
+Understanding {topic} requires examining historical development and current conditions. This section provides essential foundation information.
+
+Key aspects include major developments, influential factors, current trends, and existing frameworks. This background establishes necessary context for subsequent analysis.""",
+        topic='this field')),
+)
+
+# Generic templates, one of which is picked deterministically per section/topic
+_GENERIC_TEMPLATES = (
+    _Template(
+        """This {section} provides a focused analysis of {topic}. Key aspects include fundamental concepts, current trends, and practical applications.
+
+The content is structured to deliver clear insights and actionable information suitable for business documentation.""",
+        topic='the topic'),
+    _Template(
+        """In this {section}, we examine core concepts related to {topic}. The discussion covers essential information, relevant examples, and practical implications.
+
+This concise analysis provides a balanced perspective on the subject matter.""",
+        topic='this subject'),
+    _Template(
+        """This segment explores fundamental aspects of {topic}. It presents key information organized for easy understanding and practical application.
+
+The analysis is based on careful consideration of available information and expert perspectives.""",
+        topic='the main topic'),
+)
+
+
+class FallbackGenerator:
+    """Offline section content used when the Gemini API is unavailable.
+
+    Output depends only on (seed, section_title, topic), so results are
+    reproducible across workers and safe for callers to cache.
+    """
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self._seed_crc = zlib.crc32(f"{seed}\x00".encode('utf-8'))
+
+    def generate_section(self, section_title, topic=None):
+        section = section_title or 'this section'
+        section_lower = section.lower()
+
+        for keyword, template in _KEYWORD_TEMPLATES:
+            if keyword in section_lower:
+                break
+        else:
+            template = _GENERIC_TEMPLATES[self._pick(section, topic)]
+        return template.render(section, topic)
+
+    def _pick(self, section, topic):
+        key = f"{section}\x00{topic or ''}".encode('utf-8')
+        return zlib.crc32(key, self._seed_crc) % len(_GENERIC_TEMPLATES)
@@ -1,6 +1,10 @@
-import requests
 import json
-import random
+from fallback_generator import FallbackGenerator
+
+def _requests():
+    """Import requests on the first API call so fallback-only workers never load it"""
+    import requests
+    return requests
 
 class GeminiClient:
     def __init__(self, api_key):
@@ -8,10 +12,11 @@ class GeminiClient:
         self.model_name = "gemini-2.0-flash-exp"
         self.base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model_name}:generateContent"
         self.use_fallback = False
+        self.fallback = FallbackGenerator()
     
-    def generate_content(self, prompt, context=None):
+    def generate_content(self, prompt, context=None, section_title=None):
         if self.use_fallback:
-            return self._generate_fallback_content(prompt, context)
+            return self._generate_fallback_content(prompt, context, section_title)
         
         try:
             if context:
@@ -42,23 +47,23 @@ class GeminiClient:
             }
             
             url = f"{self.base_url}?key={self.api_key}"
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = _requests().post(url, headers=headers, json=data, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
                 if 'candidates' in result and len(result['candidates']) > 0:
                     return result['candidates'][0]['content']['parts'][0]['text']
                 else:
-                    return self._generate_fallback_content(prompt, context)
+                    return self._generate_fallback_content(prompt, context, section_title)
             else:
                 print(f"API Error: {response.status_code}")
                 if response.status_code in [400, 401, 403, 404]:
                     self.use_fallback = True
-                return self._generate_fallback_content(prompt, context)
+                return self._generate_fallback_content(prompt, context, section_title)
                 
         except Exception as e:
             print(f"Error generating content: {e}")
-            return self._generate_fallback_content(prompt, context)
+            return self._generate_fallback_content(prompt, context, section_title)
     
     def refine_content(self, content, refinement_prompt):
         if self.use_fallback:
@@ -98,7 +103,7 @@ class GeminiClient:
             }
             
             url = f"{self.base_url}?key={self.api_key}"
-            response = requests.post(url, headers=headers, json=data)
+            response = _requests().post(url, headers=headers, json=data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -157,7 +162,7 @@ class GeminiClient:
             }
             
             url = f"{self.base_url}?key={self.api_key}"
-            response = requests.post(url, headers=headers, json=data)
+            response = _requests().post(url, headers=headers, json=data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -175,54 +180,23 @@ class GeminiClient:
         except Exception as e:
             return self._generate_fallback_outline(topic, doc_type)
     
-    def _generate_fallback_content(self, prompt, context=None):
+    def _generate_fallback_content(self, prompt, context=None, section_title=None):
         """Generate concise sample content"""
-        section_name = "this section"
-        if "section:" in prompt.lower():
-            try:
-                section_name = prompt.split("section:")[1].split("'")[1] if "'" in prompt else "this section"
-            except:
-                pass
-        
-        # Concise content templates (150-200 words)
-        content_templates = [
-            f"""This {section_name} provides a focused analysis of {context or 'the topic'}. Key aspects include fundamental concepts, current trends, and practical applications.
-
-The content is structured to deliver clear insights and actionable information suitable for business documentation.""",
-            
-            f"""In this {section_name}, we examine core concepts related to {context or 'this subject'}. The discussion covers essential information, relevant examples, and practical implications.
-
-This concise analysis provides a balanced perspective on the subject matter.""",
-            
-            f"""This segment explores fundamental aspects of {context or 'the main topic'}. It presents key information organized for easy understanding and practical application.
-
-The analysis is based on careful consideration of available information and expert perspectives."""
-        ]
-        
-        section_lower = section_name.lower()
-        if "introduction" in section_lower:
-            return f"""Introduction to {context or 'the Topic'}
-
-This document provides a focused overview of {context or 'the chosen subject'}. The introduction establishes context, defines key terms, and outlines the document structure.
-
-Key objectives include providing background information, establishing relevance, and previewing main sections. This analysis aims to deliver valuable insights for informed decision-making."""
-        
-        elif "conclusion" in section_lower:
-            return f"""Conclusion and Recommendations
-
-Based on the analysis presented, key conclusions regarding {context or 'the subject matter'} include identified opportunities, current challenges, and strategic recommendations.
-
-Main findings suggest potential for improvement and optimization. Recommendations focus on implementation strategies and success measurement."""
-        
-        elif "background" in section_lower:
-            return f"""Background and Context
-
-Understanding {context or 'this field'} requires examining historical development and current conditions. This section provides essential foundation information.
-
-Key aspects include major developments, influential factors, current trends, and existing frameworks. This background establishes necessary context for subsequent analysis."""
-        
-        else:
-            return random.choice(content_templates)
+        if section_title is None:
+            section_title = self._parse_section_title(prompt)
+        return self.fallback.generate_section(section_title, context)
+    
+    @staticmethod
+    def _parse_section_title(prompt):
+        """Recover the section name from a free-form prompt for callers that don't pass it"""
+        start = prompt.find("section:")
+        if start < 0:
+            return None
+        start = prompt.find("'", start)
+        if start < 0:
+            return None
+        end = prompt.find("'", start + 1)
+        return prompt[start + 1:end] if end >= 0 else prompt[start + 1:]
     
     def _generate_fallback_refinement(self, content, refinement_prompt):
         refinement = refinement_prompt.lower()
@@ -0,0 +1,126 @@
+import functools
+import hashlib
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app, jsonify, make_response, request, session
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
+
+from models import db, IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+def _table_ready():
+    """Whether init-db has created the idempotency table; databases from before it may lack it."""
+    state = current_app.extensions.setdefault('idempotency', {'table_ready': False, 'warned': False})
+    if not state['table_ready']:
+        # Re-checked on every keyed request until found, so running init-db needs no restart
+        state['table_ready'] = inspect(db.engine).has_table(IdempotencyKey.__tablename__)
+        if not state['table_ready'] and not state['warned']:
+            print(f"Warning: table '{IdempotencyKey.__tablename__}' is missing; "
+                  f"{HEADER} is ignored until 'flask --app app init-db' is run")
+            state['warned'] = True
+    return state['table_ready']
+
+
+def _fingerprint():
+    digest = hashlib.sha256()
+    digest.update(request.method.encode('utf-8'))
+    digest.update(request.path.encode('utf-8'))
+    digest.update(request.get_data())
+    return digest.hexdigest()
+
+
+def _replay(record):
+    response = current_app.response_class(record.response_body, status=record.status_code,
+                                          mimetype=record.mimetype)
+    response.headers[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def _wait_for(record):
+    """Poll while the request holding record's key is in flight.
+
+    Returns the completed record, None if the key was released, or the
+    still in-progress record if IDEMPOTENCY_WAIT ran out.
+    """
+    user_id, key = record.user_id, record.key
+    deadline = time.monotonic() + current_app.config.get('IDEMPOTENCY_WAIT', 120)
+    while time.monotonic() < deadline:
+        time.sleep(current_app.config.get('IDEMPOTENCY_POLL_INTERVAL', 0.25))
+        # End the transaction so the next read sees commits from the other request
+        db.session.rollback()
+        record = IdempotencyKey.query.filter_by(user_id=user_id, key=key).first()
+        if record is None or record.status == 'completed':
+            return record
+    return record
+
+
+def idempotent(view):
+    """Deduplicate POSTs that carry an Idempotency-Key header.
+
+    The first request with a given key runs the view and stores its
+    response for IDEMPOTENCY_TTL seconds. Repeats of that key replay the
+    stored response, or wait for it while the first request is still in
+    flight. Requests without the header, without a logged-in user, or
+    against a database that has no idempotency table yet run the view
+    unchanged.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(HEADER)
+        user_id = session.get('user_id')
+        if not key or not user_id or not _table_ready():
+            return view(*args, **kwargs)
+        if len(key) > 255:
+            return jsonify({'error': f'{HEADER} must be at most 255 characters'}), 400
+
+        now = datetime.utcnow()
+        fingerprint = _fingerprint()
+        IdempotencyKey.query.filter(IdempotencyKey.expires_at < now).delete()
+        record = IdempotencyKey(
+            user_id=user_id,
+            key=key,
+            fingerprint=fingerprint,
+            expires_at=now + timedelta(seconds=current_app.config.get('IDEMPOTENCY_TTL', 3600))
+        )
+        db.session.add(record)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            existing = IdempotencyKey.query.filter_by(user_id=user_id, key=key).first()
+            if existing is not None and existing.fingerprint != fingerprint:
+                return jsonify({'error': f'{HEADER} was already used for a different request'}), 422
+            if existing is not None and existing.status == 'in_progress':
+                existing = _wait_for(existing)
+                if existing is not None and existing.status == 'in_progress':
+                    return jsonify({'error': 'A request with this Idempotency-Key is still in progress'}), 409
+            if existing is not None:
+                return _replay(existing)
+            # The original attempt failed and released the key; claim it again
+            return wrapper(*args, **kwargs)
+
+        try:
+            response = make_response(view(*args, **kwargs))
+        except Exception:
+            db.session.rollback()
+            db.session.delete(record)
+            db.session.commit()
+            raise
+
+        if response.status_code >= 500:
+            # Let the client retry server errors with the same key
+            db.session.delete(record)
+        else:
+            record.status = 'completed'
+            record.status_code = response.status_code
+            record.response_body = response.get_data(as_text=True)
+            record.mimetype = response.mimetype
+        db.session.commit()
+        return response
+
+    return wrapper
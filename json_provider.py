@@ -0,0 +1,60 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; falls back to the stdlib json module
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson when it is installed.
+
+    Non-string keys are stringified and datetimes are handed to
+    ``default`` so they keep Flask's HTTP-date format. Anything orjson
+    still rejects (e.g. integers wider than 64 bits) is serialized by the
+    default provider instead. Two differences remain visible: non-ASCII
+    text is emitted as UTF-8 rather than \\u escapes, and non-finite
+    floats (NaN, Infinity) become null instead of the stdlib's
+    non-standard NaN/Infinity tokens.
+    """
+
+    def _options(self, indent=None):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    @staticmethod
+    def _orjson_layout(kwargs):
+        """Whether orjson can reproduce the stdlib layout for these json.dumps arguments."""
+        if set(kwargs) - {'indent', 'separators'}:
+            return False
+        indent = kwargs.get('indent')
+        separators = kwargs.get('separators')
+        if indent is None:
+            return separators == (',', ':')
+        return indent == 2 and separators in (None, (',', ': '))
+
+    def dumps(self, obj, **kwargs):
+        # orjson only writes compact or two-space-indented output
+        if orjson is None or not self._orjson_layout(kwargs):
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options(kwargs.get('indent'))).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = orjson.dumps(obj, default=self.default,
+                                option=self._options(indent) | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
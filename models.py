@@ -39,4 +39,17 @@ class RefinementHistory(db.Model):
     new_content = db.Column(db.Text)
     user_feedback = db.Column(db.String(10))  # 'like' or 'dislike'
     comments = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class IdempotencyKey(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    key = db.Column(db.String(255), nullable=False)
+    fingerprint = db.Column(db.String(64), nullable=False)  # sha256 of method, path and body
+    status = db.Column(db.String(20), nullable=False, default='in_progress')  # 'in_progress' or 'completed'
+    status_code = db.Column(db.Integer)
+    response_body = db.Column(db.Text)
+    mimetype = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    __table_args__ = (db.UniqueConstraint('user_id', 'key'),)
\ No newline at end of file
@@ -0,0 +1,141 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+
+from flask import Response, abort, current_app, render_template, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Hashed asset URLs never change content; pages must revalidate so new hashes are picked up
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+PAGE_CACHE_CONTROL = 'no-cache'
+
+# Server preference; werkzeug's best_match breaks quality ties in this order
+ENCODING_PREFERENCE = ('br', 'gzip', 'identity')
+
+
+def _compress(body):
+    """Return the encodings worth serving for body, keyed by Content-Encoding."""
+    variants = {'identity': body}
+    gz = gzip.compress(body, compresslevel=9, mtime=0)
+    if len(gz) < len(body):
+        variants['gzip'] = gz
+    if brotli is not None:
+        br = brotli.compress(body, quality=11)
+        if len(br) < len(body):
+            variants['br'] = br
+    return variants
+
+
+class _Entry:
+    """A static body with its encoded variants and prebuilt response headers."""
+
+    def __init__(self, body, mimetype, cache_control):
+        self.digest = hashlib.sha256(body).hexdigest()[:16]
+        self.variants = {}
+        for encoding, data in _compress(body).items():
+            etag = self.digest if encoding == 'identity' else f"{self.digest}-{encoding}"
+            headers = [
+                ('Content-Type', mimetype),
+                ('Cache-Control', cache_control),
+                ('ETag', f'"{etag}"'),
+                ('Vary', 'Accept-Encoding'),
+            ]
+            if encoding != 'identity':
+                headers.append(('Content-Encoding', encoding))
+            self.variants[encoding] = (data, etag, headers)
+        self.encodings = [encoding for encoding in ENCODING_PREFERENCE if encoding in self.variants]
+
+
+class _AppState:
+    """Per-app asset tables and page cache, kept in app.extensions['static_delivery']."""
+
+    def __init__(self, static_folder):
+        self.assets = {}
+        self.hashed_paths = {}
+        self.pages = {}
+        if static_folder and os.path.isdir(static_folder):
+            self._load_assets(static_folder)
+
+    def _load_assets(self, static_folder):
+        for root, _, files in os.walk(static_folder):
+            for name in files:
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, static_folder).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    body = f.read()
+                mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                if mimetype.startswith('text/'):
+                    mimetype += '; charset=utf-8'
+                entry = _Entry(body, mimetype, ASSET_CACHE_CONTROL)
+                stem, ext = os.path.splitext(filename)
+                hashed_path = f"{stem}.{entry.digest[:10]}{ext}"
+                self.assets[filename] = hashed_path
+                self.hashed_paths[hashed_path] = entry
+
+
+class StaticDelivery:
+    """Serve static assets and template-only pages from memory.
+
+    Assets under the static folder are hashed and compressed once at
+    startup and exposed at content-hashed URLs with an immutable
+    Cache-Control. Pages are rendered on first hit and then served from
+    the cache with ETag revalidation, unless the app is in debug mode or
+    TEMPLATES_AUTO_RELOAD is set; then pages are rendered per request and
+    link to the live files under /static/.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['static_delivery'] = _AppState(app.static_folder)
+        app.add_url_rule('/assets/<path:hashed_path>', 'hashed_asset', self.serve_asset)
+        app.jinja_env.globals['asset_url'] = self.asset_url
+
+    @staticmethod
+    def _state():
+        return current_app.extensions['static_delivery']
+
+    def asset_url(self, filename):
+        hashed_path = self._state().assets.get(filename)
+        if hashed_path is None or self._reloading():
+            return f"/static/{filename}"
+        return f"/assets/{hashed_path}"
+
+    def serve_asset(self, hashed_path):
+        entry = self._state().hashed_paths.get(hashed_path)
+        if entry is None:
+            abort(404)
+        return self._respond(entry)
+
+    @staticmethod
+    def _reloading():
+        return current_app.debug or current_app.config.get('TEMPLATES_AUTO_RELOAD')
+
+    def page(self, template_name):
+        if self._reloading():
+            # Template edits must show up on the next request during development
+            return render_template(template_name)
+        pages = self._state().pages
+        entry = pages.get(template_name)
+        if entry is None:
+            body = render_template(template_name).encode('utf-8')
+            entry = pages[template_name] = _Entry(body, 'text/html; charset=utf-8', PAGE_CACHE_CONTROL)
+        return self._respond(entry)
+
+    def _respond(self, entry):
+        encoding = request.accept_encodings.best_match(entry.encodings, default='identity')
+        data, etag, headers = entry.variants[encoding]
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304, headers=headers[1:])
+        else:
+            response = Response(data, headers=headers)
+        # Already negotiated here; ResponseCompression must not re-encode it
+        response.precompressed = True
+        return response